@@ -0,0 +1,140 @@
+"""
+Complete distance table for small boards (3x3 and the like): stores the exact
+number of moves from _every_ state to one goal board, indexed by the state's
+permutation rank. Afterwards an optimal solution is read off by always moving
+to a neighbour one step closer to the goal ("greedy descent"), without any
+search.
+
+A 3x3 table has `9!` one byte entries (~360KB, 181.440 of them reachable) and
+takes a few seconds to build, so it's meant to be built once and `save()`d.
+"""
+
+import os
+import struct
+from math import factorial
+
+from n_puzzle import NPuzzleBoard, MoveDirection
+from permutation_rank import lehmer_rank
+from search_strategy import DirectSearchBase
+
+_MAGIC = b"NPDT"
+_VERSION = 1
+# value of states not reachable from the goal (i.e. unsolvable ones)
+UNREACHABLE = 255
+
+
+class DistanceTable(DirectSearchBase):
+    """
+    Exact distances to `goal` for all states of its shape.
+
+    Can be used as search strategy (`NPuzzleSolver(game, table)`), as perfect
+    heuristic function `(current, goal) -> int` or directly via `solve()`.
+    """
+
+    def __init__(self, goal: NPuzzleBoard, table: bytes | bytearray):
+        """Use `build()`, `load()` or `for_goal()` rather than creating instances directly."""
+        super().__init__()
+        self.goal = goal
+        self.table = table
+        # translates tile values to their index in the sorted goal tiles, so boards
+        # become permutations of `range(n)` (the empty field `0` stays `0`)
+        translation = bytearray(range(256))
+        for i, val in enumerate(sorted(goal.tiles)):
+            translation[val] = i
+        self._translation = bytes(translation)
+
+    def rank(self, board: NPuzzleBoard) -> int:
+        return lehmer_rank(board.tiles.translate(self._translation))
+
+    def distance(self, board: NPuzzleBoard) -> int | None:
+        """Returns the number of moves from `board` to the goal or `None` if unreachable."""
+        dist = self.table[self.rank(board)]
+        return None if dist == UNREACHABLE else dist
+
+    def __call__(self, current: NPuzzleBoard, goal: NPuzzleBoard) -> int:
+        if goal is not self.goal and goal != self.goal:
+            raise ValueError("distance table was built for a different goal board")
+        return self.table[self.rank(current)]
+
+    def solve(self, start: NPuzzleBoard) -> list[MoveDirection] | None:
+        """Returns an optimal solution for `start` or `None`, if it is unsolvable."""
+        dist = self.distance(start)
+        if dist is None:
+            return None
+        moves = []
+        board = start
+        while dist > 0:
+            for mv_dir, successor in board.successors():
+                if self.table[self.rank(successor)] == dist - 1:
+                    moves.append(mv_dir)
+                    board = successor
+                    dist -= 1
+                    break
+        self.expanded += len(moves)
+        return moves
+
+    def search(self, start: NPuzzleBoard, goal: NPuzzleBoard | None = None) -> list[MoveDirection] | None:
+        if goal is not None and goal != self.goal:
+            raise ValueError("distance table was built for a different goal board")
+        self.expanded = 0
+        return self.solve(start)
+
+    @classmethod
+    def build(cls, goal: NPuzzleBoard) -> 'DistanceTable':
+        """Builds the table by a breadth first search backwards from `goal`."""
+        if type(goal.tiles) is not bytes:
+            raise ValueError("distance tables are only supported for small boards")
+        table = bytearray([UNREACHABLE]) * factorial(goal.N + 1)
+        pdt = cls(goal, table)
+        table[pdt.rank(goal)] = 0
+
+        frontier = [goal]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for board in frontier:
+                for _, successor in board.successors():
+                    rank = pdt.rank(successor)
+                    if table[rank] == UNREACHABLE:
+                        table[rank] = depth
+                        next_frontier.append(successor)
+            frontier = next_frontier
+        return pdt
+
+    def save(self, path: str) -> None:
+        """Writes magic, version, rows, cols, goal tiles and the table to `path`."""
+        rows, cols = self.goal.shape
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<HHH", _VERSION, rows, cols))
+            f.write(self.goal.tiles)
+            f.write(self.table)
+
+    @classmethod
+    def load(cls, path: str) -> 'DistanceTable':
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:4] != _MAGIC:
+            raise ValueError(f"'{path}' is no distance table file")
+        version, rows, cols = struct.unpack_from("<HHH", data, 4)
+        if version != _VERSION:
+            raise ValueError(f"unsupported distance table version {version}")
+        n_fields = rows * cols
+        goal = NPuzzleBoard.from_tiles(data[10:10 + n_fields], rows, cols)
+        table = data[10 + n_fields:]
+        if len(table) != factorial(n_fields):
+            raise ValueError(f"'{path}' is truncated")
+        return cls(goal, table)
+
+    @classmethod
+    def for_goal(cls, goal: NPuzzleBoard, path: str) -> 'DistanceTable':
+        """Loads the table from `path`, or builds and saves it there if there is none yet."""
+        if os.path.exists(path):
+            pdt = cls.load(path)
+            if pdt.goal == goal:
+                return pdt
+        pdt = cls.build(goal)
+        pdt.save(path)
+        return pdt
+
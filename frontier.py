@@ -0,0 +1,112 @@
+"""
+Expansion queues ("frontiers") for the search strategies. The solver is single
+threaded, so unlike `queue.Queue` and friends these don't lock on every access.
+
+All frontiers share the interface `put(item, priority=None)`, `get()`,
+`empty()` and `len()`. `priority` is ignored by the unordered ones.
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+
+
+class FifoFrontier:
+    """First in, first out (breadth first)."""
+
+    def __init__(self):
+        self._items = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put(self, item, priority=None):
+        self._items.append(item)
+
+    def get(self):
+        return self._items.popleft()
+
+
+class LifoFrontier:
+    """Last in, first out (depth first)."""
+
+    def __init__(self):
+        self._items = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put(self, item, priority=None):
+        self._items.append(item)
+
+    def get(self):
+        return self._items.pop()
+
+
+class HeapFrontier:
+    """
+    Returns the item with the lowest `priority` first. Priorities may be any
+    comparable values, e.g. tuples. Items with equal priority are returned in
+    insertion order, so items themselves are never compared.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def empty(self) -> bool:
+        return not self._heap
+
+    def put(self, item, priority):
+        heapq.heappush(self._heap, (priority, next(self._counter), item))
+
+    def get(self):
+        return heapq.heappop(self._heap)[2]
+
+
+class BucketFrontier:
+    """
+    Returns the item with the lowest `priority` first, where priorities must be
+    non-negative integers (e.g. `f`-values of N-Puzzle states, which are small).
+    Keeps one bucket per priority, so `put` and `get` are `O(1)` (amortized).
+    Items with equal priority are returned last in, first out, which favors the
+    deepest of equally rated states.
+    """
+
+    def __init__(self):
+        self._buckets: list[list] = []
+        self._min = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def put(self, item, priority: int):
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(item)
+        if priority < self._min or self._size == 0:
+            self._min = priority
+        self._size += 1
+
+    def get(self):
+        if self._size == 0:
+            raise IndexError("get from an empty frontier")
+        buckets = self._buckets
+        while not buckets[self._min]:
+            self._min += 1
+        self._size -= 1
+        return buckets[self._min].pop()
@@ -30,18 +30,18 @@ class TkGameBoard(Canvas):
         remove_border(self)
 
         # Init empty fields
-        epb = from_epb
+        state = from_epb.state
         self.fields: list[list[TkGameBoardField]] = []
 
-        cols = len(epb.state[0])
-        rows = len(epb.state)
+        cols = len(state[0])
+        rows = len(state)
 
         for c in range(cols):
             self.fields.append([])
             for r in range(rows):
                 pos = self.grid_position(c, r)
                 self.fields[c].append(
-                    TkGameBoardField(self, pos, self.field_size, from_epb.state[c][r]))
+                    TkGameBoardField(self, pos, self.field_size, state[c][r]))
 
         # Configure fields according to `from_epb`
         self.set_state(from_epb)
@@ -56,12 +56,14 @@ class TkGameBoard(Canvas):
         """
         Reconfigures this canvas's items to match state represented by `epb`.
         """
-        cols = len(board.state[0])
-        rows = len(board.state)
+        # `state` is built on each access, so only fetch it once
+        state = board.state
+        cols = len(state[0])
+        rows = len(state)
 
         for c in range(cols):
             for r in range(rows):
-                field_val = board.state[r][c]
+                field_val = state[r][c]
                 f = self.fields[c][r]
                 f.set_value(field_val)
 
@@ -183,7 +183,7 @@ class NPuzzleGUI(ttk.Frame):
         next_step = self.solver.next_solution_step()
         if next_step is not None:
             self._step_cnt += 1
-            self.game.board.mv_empty(next_step)
+            self.game.board = self.game.board.with_move(next_step)
             self.board.set_state(self.game.board)
             self.log_panel.add_message(f"{self._step_cnt:<3} Move: {next_step.__repr__()}")
 
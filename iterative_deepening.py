@@ -0,0 +1,114 @@
+"""
+Depth-first search strategies, that don't need an expansion queue. Instead of
+storing the search frontier, they walk a single, in-place modified board along
+the current path and iteratively raise a cost bound. Thus memory usage is only
+`O(solution length)`, which makes them suitable for boards where `A*` runs out
+of memory (e.g. random 4x4 boards).
+"""
+
+from math import inf
+
+from n_puzzle import NPuzzleBoard, MoveDirection
+from n_puzzle_heuristics import heuristic_delta_fn
+from search_strategy import DirectSearchBase
+
+
+class IterativeDeepeningBase(DirectSearchBase):
+    """
+    Base class for depth-first strategies, which iteratively raise a cost bound.
+    """
+
+
+class IDAStarSearch(IterativeDeepeningBase):
+    """
+    Iterative Deepening A* (`IDA*`). Runs depth-first searches, pruning paths whose
+    approx. costs (`path_cost + heuristic`) exceed a bound, which is raised to the
+    smallest exceeding value after each iteration. The first solution found is
+    optimal, given an admissible heuristic function.
+
+    Moves undoing the previous move are never tried. Heuristics supporting
+    incremental evaluation (see `n_puzzle_heuristics.heuristic_delta_fn`) are
+    updated per move instead of being evaluated from scratch.
+    """
+
+    def __init__(self, goal_state: NPuzzleBoard, heuristic_fn):
+        super().__init__()
+        self.goal = goal_state
+        # function that given an input state and the goal state returns a rating for input
+        self.hfn = heuristic_fn
+
+    def search(self, start: NPuzzleBoard, goal: NPuzzleBoard | None = None) -> list[MoveDirection] | None:
+        goal = self.goal if goal is None else goal
+        if start.shape != goal.shape:
+            raise ValueError("start and goal board must have the same dimensions")
+        self.expanded = 0
+
+        rows, cols = start.shape
+        # single board, modified in place and restored on backtracking
+        tiles = _mutable_tiles(start.tiles)
+        goal_tiles = _mutable_tiles(goal.tiles)
+        neighbours = _neighbour_table(rows, cols)
+        h_delta = heuristic_delta_fn(self.hfn, goal)
+        hfn = self.hfn
+        path: list[MoveDirection] = []
+        h_start = hfn(start, goal)
+        bound = h_start
+
+        def rate(blank: int, h: int, tile: int, from_idx: int) -> int:
+            # `tile` has just been moved from `from_idx` to the former empty field `blank`
+            if h_delta is not None:
+                return h + h_delta(tiles, tile, from_idx, blank)
+            return hfn(NPuzzleBoard.from_tiles(type(goal.tiles)(tiles), rows, cols, from_idx), goal)
+
+        def dfs(g: int, h: int, blank: int, last_mv: MoveDirection | None) -> float:
+            """Returns `-1` if a solution was found, else the smallest exceeding cost."""
+            f = g + h
+            if f > bound:
+                return f
+            if tiles == goal_tiles:
+                return -1
+
+            self.expanded += 1
+            min_exceeding = inf
+            for mv_dir, target in neighbours[blank]:
+                if last_mv is not None and mv_dir is last_mv.inverse:
+                    continue
+                tile = tiles[target]
+                tiles[blank], tiles[target] = tile, 0
+                path.append(mv_dir)
+
+                t = dfs(g + 1, rate(blank, h, tile, target), target, mv_dir)
+                if t == -1:
+                    return -1
+
+                path.pop()
+                tiles[blank], tiles[target] = 0, tile
+                if t < min_exceeding:
+                    min_exceeding = t
+            return min_exceeding
+
+        while True:
+            t = dfs(0, h_start, start.blank_index, None)
+            if t == -1:
+                return path
+            if t == inf:
+                return None
+            bound = t
+
+
+def _mutable_tiles(tiles: bytes | tuple) -> bytearray | list:
+    return bytearray(tiles) if type(tiles) is bytes else list(tiles)
+
+
+def _neighbour_table(rows: int, cols: int) -> list[list[tuple[MoveDirection, int]]]:
+    """For each field index a list of `(<move>, <target index>)` of valid moves."""
+    table = []
+    for idx in range(rows * cols):
+        row, col = divmod(idx, cols)
+        moves = []
+        for mv_dir in MoveDirection:
+            t_row, t_col = row + mv_dir.value.x, col + mv_dir.value.y
+            if 0 <= t_row < rows and 0 <= t_col < cols:
+                moves.append((mv_dir, t_row * cols + t_col))
+        table.append(moves)
+    return table
@@ -20,14 +20,14 @@ def assignment_example_solution():
 
     print("--- Exhaustive search ---")
     print(solver.solve(True))
-    # >>> Iterations to finish: 102
+    # >>> Expansions to finish: 100 (generated: 160, duplicates pruned: 61, re-opened: 0)
     # >>> [up, up, left, down, right]
 
     # Returns first found solution
     print("--- Lazy search ---")
     print(solver.solve(False))
 
-    # >>> Iterations to finish: 37
+    # >>> Expansions to finish: 37 (generated: 100, duplicates pruned: 35, re-opened: 0)
     # >>> [up, up, left, down, right]
 
     # ===================== Depth First ========================================
@@ -50,12 +50,12 @@ def assignment_example_solution():
 
     print("--- Exhaustive search ---")
     print(solver.solve(True))
-    # >>> Expansions to finish: 100
+    # >>> Expansions to finish: 100 (generated: 160, duplicates pruned: 61, re-opened: 0)
     # >>> [up, up, left, down, right]
 
     print("--- Lazy search ---")
     print(solver.solve(False))
-    # >>> Expansions to finish: 6
+    # >>> Expansions to finish: 6 (generated: 15, duplicates pruned: 4, re-opened: 0)
     # >>> [up, up, left, down, right]
 
     print("\n~~~ A* - Heuristic 2: 'count_wrong_positions' ~~~")
@@ -64,12 +64,12 @@ def assignment_example_solution():
 
     print("--- Exhaustive search ---")
     print(solver.solve(True))
-    # >>> Expansions to finish: 102
+    # >>> Expansions to finish: 100 (generated: 160, duplicates pruned: 61, re-opened: 0)
     # >>> [up, up, left, down, right]
 
     print("--- Lazy search ---")
     print(solver.solve(False))
-    # >>> Expansions to finish: 6
+    # >>> Expansions to finish: 6 (generated: 15, duplicates pruned: 4, re-opened: 0)
     # >>> [up, up, left, down, right]
 
 
@@ -1,6 +1,5 @@
 import functools
 import random
-from copy import deepcopy
 from enum import Enum
 from math import sqrt
 from vec2 import Vec2
@@ -20,47 +19,186 @@ class MoveDirection(Enum):
         # quick 'n dirty...
         return self.value._coords.__lt__(other.value._coords)
 
+    @property
+    def inverse(self) -> 'MoveDirection':
+        """The move undoing this one."""
+        return _INVERSE_MOVES[self]
+
+
+_INVERSE_MOVES = {
+    MoveDirection.DOWN: MoveDirection.UP,
+    MoveDirection.UP: MoveDirection.DOWN,
+    MoveDirection.RIGHT: MoveDirection.LEFT,
+    MoveDirection.LEFT: MoveDirection.RIGHT,
+}
+
+# (row, col) offsets of the empty field per move
+_MOVE_DELTAS = {mv_dir: (mv_dir.value.x, mv_dir.value.y) for mv_dir in MoveDirection}
+
+
+def _swapped(tiles: bytes | tuple, i: int, j: int) -> bytes | tuple:
+    """Returns a copy of the flat `tiles` with the values at `i` and `j` swapped."""
+    if type(tiles) is bytes:
+        buf = bytearray(tiles)
+        buf[i], buf[j] = buf[j], buf[i]
+        return bytes(buf)
+    buf = list(tiles)
+    buf[i], buf[j] = buf[j], buf[i]
+    return tuple(buf)
+
 
 class NPuzzleBoard:
+    """
+    Immutable board of a N-Puzzle.
+
+    The state is stored as flat, row-major `bytes` (one byte per field, `0`
+    encoding the empty field), so boards are cheap to copy, compare and hash.
+    Boards with tile values beyond a byte fall back to a flat `tuple`.
+    The familiar list-of-lists representation is still available via `state`,
+    but it is built on demand and meant for display and tests only.
+    """
+    __slots__ = ("_tiles", "_rows", "_cols", "_blank", "_hash")
+
     def __init__(self, state: list[list]):
         """
         `state`: 2D-array with "rows x cols"
         """
-        self.state = state
-        # validate state has an empty field
-        _ = self.empty_field_pos()
+        rows = len(state)
+        cols = len(state[0]) if rows > 0 else 0
+        if any(len(row) != cols for row in state):
+            raise ValueError("all rows of a puzzle board state must have the same length")
+
+        flat = []
+        for row in state:
+            for val in row:
+                if val is None:
+                    flat.append(0)
+                elif isinstance(val, int) and val > 0:
+                    flat.append(val)
+                else:
+                    raise ValueError(f"invalid tile value {val!r}, expected positive int or None")
+
+        if flat.count(0) != 1:
+            # validate state has exactly one empty field
+            raise ValueError("no empty field found in puzzle board state" if 0 not in flat
+                             else "more than one empty field found in puzzle board state")
+
+        tiles = bytes(flat) if max(flat) < 256 else tuple(flat)
+        self._init_slots(tiles, rows, cols, flat.index(0))
+
+    def _init_slots(self, tiles: bytes | tuple, rows: int, cols: int, blank: int) -> None:
+        self._tiles = tiles
+        self._rows = rows
+        self._cols = cols
+        self._blank = blank
+        self._hash = hash(tiles)
+
+    @classmethod
+    def from_tiles(cls, tiles: bytes | tuple, rows: int, cols: int, blank: int | None = None) -> 'NPuzzleBoard':
+        """
+        Creates a board directly from its flat encoding (see `tiles`), skipping
+        validation. `blank` is the empty field's index and is looked up if omitted.
+        """
+        board = cls.__new__(cls)
+        board._init_slots(tiles, rows, cols, tiles.index(0) if blank is None else blank)
+        return board
 
     def __repr__(self) -> str:
         s = "["
-        last_i = len(self.state) - 1
-        for i, row in enumerate(self.state):
+        state = self.state
+        last_i = len(state) - 1
+        for i, row in enumerate(state):
             s += str(row) + ("," if i != last_i else "]")
         return s
 
     def clone(self) -> 'NPuzzleBoard':
-        state_clone = deepcopy(self.state)
-        return type(self)(state_clone)
+        # the encoding is immutable, so it can be shared
+        return self.from_tiles(self._tiles, self._rows, self._cols, self._blank)
 
     def __eq__(self, other: 'NPuzzleBoard') -> bool:
-        return self.state == other.state
+        if not isinstance(other, NPuzzleBoard):
+            return NotImplemented
+        return self._tiles == other._tiles and self._cols == other._cols
 
     def __hash__(self) -> int:
-        tp_state = tuple(tuple(row) for row in self.state)
-        return hash(tp_state)
+        return self._hash
+
+    @property
+    def state(self) -> list[list]:
+        """
+        The board as "rows x cols" 2D-array, using `None` for the empty field.
+        This is a freshly built view, changing it has no effect on the board.
+        """
+        tiles, cols = self._tiles, self._cols
+        return [[val or None for val in tiles[i:i + cols]] for i in range(0, len(tiles), cols)]
+
+    @property
+    def tiles(self) -> bytes | tuple:
+        """Flat, row-major encoding of the board, where `0` is the empty field."""
+        return self._tiles
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """`(rows, cols)` of this board."""
+        return (self._rows, self._cols)
+
+    @property
+    def blank_index(self) -> int:
+        """Index of the empty field inside `tiles`."""
+        return self._blank
+
+    @property
+    def packed(self) -> int:
+        """
+        The board packed into a single integer using `bits_per_tile` bits per field,
+        e.g. 4 bits per field for a 15-Puzzle. Useful as compact key.
+        """
+        bits = self.bits_per_tile
+        key = 0
+        for val in self._tiles:
+            key = (key << bits) | val
+        return key
+
+    @property
+    def bits_per_tile(self) -> int:
+        return max(1, max(self._tiles).bit_length())
 
     @property
     def N(self) -> int:
-        return len(self.state)**2 - 1
+        return self._rows * self._cols - 1
 
     def empty_field_pos(self) -> Vec2:
         """
         Returns the position of the empty field.
         """
-        empty_pos = self.get_pos_of(None)
-        if empty_pos is None:
-            raise ValueError("no empty field found in puzzle board state")
-        else:
-            return empty_pos
+        return Vec2(*divmod(self._blank, self._cols))
+
+    def with_move(self, mv_dir: MoveDirection) -> 'NPuzzleBoard | None':
+        """
+        Returns the board resulting from moving the empty field in `mv_dir` or
+        `None`, if that's not a valid move.
+        """
+        d_row, d_col = _MOVE_DELTAS[mv_dir]
+        row, col = divmod(self._blank, self._cols)
+        row += d_row
+        col += d_col
+        if 0 <= row < self._rows and 0 <= col < self._cols:
+            target = row * self._cols + col
+            return self.from_tiles(_swapped(self._tiles, self._blank, target),
+                                   self._rows, self._cols, target)
+        return None
+
+    def successors(self) -> list[tuple[MoveDirection, 'NPuzzleBoard']]:
+        """
+        Returns list of pairs `(<move>, <new_board>)` for every valid move of
+        the empty field.
+        """
+        result = []
+        for mv_dir in MoveDirection:
+            new_board = self.with_move(mv_dir)
+            if new_board is not None:
+                result.append((mv_dir, new_board))
+        return result
 
     def next_valid_board_states(self, mv_history: list[MoveDirection]):
         """
@@ -68,55 +206,23 @@ class NPuzzleBoard:
         - `mv_history` is the given `mv_history` with the move which led to
             `new_board` appended.
         - `new_board` is a board instance representing a possible next state.
-        """
-        boards: list[tuple[list[MoveDirection], NPuzzleBoard]] = []
-        empty_pos = self.empty_field_pos()
-
-        for mv_dir in MoveDirection:
-            target_pos = empty_pos + mv_dir.value
 
-            if self.contains_pos(target_pos):
-                new_board = self.clone()
-                # switch target and empty fields
-                new_board.swap_fields(empty_pos, target_pos)
-                mv_hist = mv_history.copy()
-                mv_hist.append(mv_dir)
-                boards.append((mv_hist, new_board))
-        return boards
-
-    def swap_fields(self, field_1: Vec2, field_2: Vec2) -> None:
-        """
-        Swaps content of field at `field_1` with `field_2`'s.
+        Note: Copies `mv_history` per board. Searches should rather expand
+        `search_node.SearchNode`s, which only link to their parent.
         """
-        f1_row, f1_col = (field_1.x, field_1.y)
-        f2_row, f2_col = (field_2.x, field_2.y)
-        f1_tmp = self.state[f1_row][f1_col]
-        self.state[f1_row][f1_col] = self.state[f2_row][f2_col]
-        self.state[f2_row][f2_col] = f1_tmp
+        return [(mv_history + [mv_dir], new_board) for mv_dir, new_board in self.successors()]
 
     def contains_pos(self, position: Vec2):
         r, c = (position.x, position.y)
-        return (r >= 0 and r < len(self.state) and
-                c >= 0 and c < len(self.state[0]))
+        return (r >= 0 and r < self._rows and
+                c >= 0 and c < self._cols)
 
     def get_pos_of(self, target) -> Vec2 | None:
-        for row_idx, row in enumerate(self.state):
-            try:
-                col_idx = row.index(target)
-                return Vec2(row_idx, col_idx)
-            except ValueError:
-                continue
-        return None
-
-    def mv_empty(self, mv_dir: MoveDirection):
-        """
-        Moves empty field in `mv_dir`. If it's not a valid move, it is silently 
-        ignored.
-        """
-        empty_pos = self.empty_field_pos()
-        target_pos = empty_pos + mv_dir.value
-        if self.contains_pos(target_pos):
-            self.swap_fields(empty_pos, target_pos)
+        try:
+            idx = self._tiles.index(0 if target is None else target)
+        except (ValueError, TypeError):
+            return None
+        return Vec2(*divmod(idx, self._cols))
 
     @staticmethod
     def step_distance(pos1: Vec2, pos2: Vec2):
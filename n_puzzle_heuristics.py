@@ -1,5 +1,162 @@
+import functools
+from collections import deque
+
 from n_puzzle import NPuzzleBoard
-from vec2 import Vec2
+
+
+class HeuristicContext:
+    """
+    Lookup tables for rating boards against one fixed `goal` board.
+
+    Building the tables costs `O(N²)` once, afterwards each heuristic is a
+    handful of list lookups per field. Use `heuristic_context()` to get a
+    cached instance for a goal.
+    """
+
+    def __init__(self, goal: NPuzzleBoard):
+        self.goal = goal
+        rows, cols = goal.shape
+        size = rows * cols
+        self.shape = (rows, cols)
+        # tables are indexed by tile value, so they need room for every value a board
+        # with the same encoding may hold
+        n_values = max(256, max(goal.tiles) + 1)
+
+        # goal row/col for each tile value (`None` for values not on the goal board)
+        self.goal_row: list[int | None] = [None] * n_values
+        self.goal_col: list[int | None] = [None] * n_values
+        for idx, val in enumerate(goal.tiles):
+            if val != 0:
+                self.goal_row[val], self.goal_col[val] = divmod(idx, cols)
+
+        # distances[val][idx]: steps tile `val` needs from field `idx` to its goal
+        zeros = [0] * size
+        self.distances: list[list[int]] = [zeros] * n_values
+        for val in range(n_values):
+            g_row, g_col = self.goal_row[val], self.goal_col[val]
+            if g_row is not None:
+                self.distances[val] = [
+                    abs(r - g_row) + abs(c - g_col) for r in range(rows) for c in range(cols)]
+
+        # all rows followed by all columns, each as tuple of field indices
+        self.lines: list[tuple[int, ...]] = (
+            [tuple(range(r * cols, (r + 1) * cols)) for r in range(rows)]
+            + [tuple(range(c, size, cols)) for c in range(cols)]
+        )
+        # line_of_field[idx]: (<row line>, <column line>) containing field `idx`
+        self.line_of_field: list[tuple[int, int]] = [
+            (idx // cols, rows + idx % cols) for idx in range(size)]
+        # line_keys[line][val]: goal position of tile `val` along `line`, or `-1` if
+        # the tile's goal is not on that line (i.e. it can't conflict there)
+        self.line_keys: list[list[int]] = []
+        for r in range(rows):
+            self.line_keys.append([-1 if g is None or g != r else c
+                                   for g, c in zip(self.goal_row, self.goal_col)])
+        for c in range(cols):
+            self.line_keys.append([-1 if g is None or g != c else r
+                                   for g, r in zip(self.goal_col, self.goal_row)])
+
+    def manhattan(self, tiles) -> int:
+        """See `cumulative_distance`."""
+        distances = self.distances
+        h = 0
+        for idx, val in enumerate(tiles):
+            h += distances[val][idx]
+        return h
+
+    def line_conflicts(self, tiles, line: int) -> int:
+        """Additional steps caused by linear conflicts inside the given `line`."""
+        keys = self.line_keys[line]
+        goal_idxs = [k for k in (keys[tiles[idx]] for idx in self.lines[line]) if k >= 0]
+        conflicts = 0
+        for i, g_i in enumerate(goal_idxs):
+            for other_g_i in goal_idxs[i + 1:]: # look to the right for conflicts
+                if other_g_i < g_i:
+                    conflicts += 2
+        return conflicts
+
+    def linear_conflicts(self, tiles) -> int:
+        """Additional steps caused by linear conflicts in all rows and columns."""
+        return sum(self.line_conflicts(tiles, line) for line in range(len(self.lines)))
+
+    def misplaced(self, tiles) -> int:
+        """See `count_wrong_positions`."""
+        counter = 0
+        for val1, val2 in zip(tiles, self.goal.tiles):
+            counter += 1 if val1 != val2 else 0
+        return counter
+
+    def walking_distance(self, tiles) -> int:
+        """See `walking_distance`."""
+        rows, cols = self.shape
+        goal_row, goal_col = (self.goal_row, self.goal_col)
+        # row_counts[r * rows + g]: number of tiles in row `r` with goal row `g`
+        row_counts = [0] * (rows * rows)
+        col_counts = [0] * (cols * cols)
+        for idx, val in enumerate(tiles):
+            row, col = divmod(idx, cols)
+            if val == 0:
+                blank_row, blank_col = (row, col)
+            else:
+                row_counts[row * rows + goal_row[val]] += 1
+                col_counts[col * cols + goal_col[val]] += 1
+
+        blank_goal_row, blank_goal_col = divmod(self.goal.blank_index, cols)
+        row_table = _walking_distance_table(rows, cols, blank_goal_row)
+        col_table = _walking_distance_table(cols, rows, blank_goal_col)
+        return row_table[(*row_counts, blank_row)] + col_table[(*col_counts, blank_col)]
+
+    # --- Incremental evaluation ---
+    # A move slides exactly one `tile` from field `from_idx` into the empty field at
+    # `to_idx`. The `*_delta` methods return how much the respective heuristic changes
+    # by that move, given the `tiles` _after_ the move.
+
+    def manhattan_delta(self, tiles, tile: int, from_idx: int, to_idx: int) -> int:
+        dist = self.distances[tile]
+        return dist[to_idx] - dist[from_idx]
+
+    def linear_conflicts_delta(self, tiles, tile: int, from_idx: int, to_idx: int) -> int:
+        """
+        Includes the manhattan delta. Sliding a tile along a row doesn't change the
+        order of that row, so only the two crossed columns (resp. rows for vertical
+        moves) need to be looked at, and only for conflicts involving `tile`.
+        """
+        rows, cols = self.shape
+        row_from, col_from = divmod(from_idx, cols)
+        row_to, col_to = divmod(to_idx, cols)
+        if row_from == row_to:
+            line_from, line_to, pos = (rows + col_from, rows + col_to, row_from)
+        else:
+            line_from, line_to, pos = (row_from, row_to, col_from)
+
+        return (self.manhattan_delta(tiles, tile, from_idx, to_idx)
+                + self._tile_conflicts(tiles, line_to, tile, pos)
+                - self._tile_conflicts(tiles, line_from, tile, pos))
+
+    def _tile_conflicts(self, tiles, line: int, tile: int, pos: int) -> int:
+        """Conflicts `tile` has with the other tiles of `line`, if it was at `pos`."""
+        keys = self.line_keys[line]
+        tile_key = keys[tile]
+        if tile_key < 0:
+            return 0
+        conflicts = 0
+        for other_pos, idx in enumerate(self.lines[line]):
+            key = keys[tiles[idx]]
+            if key >= 0 and (key > tile_key if other_pos < pos else key < tile_key):
+                conflicts += 2
+        return conflicts
+
+    def misplaced_delta(self, tiles, tile: int, from_idx: int, to_idx: int) -> int:
+        goal_tiles = self.goal.tiles
+        before = (tile != goal_tiles[from_idx]) + (goal_tiles[to_idx] != 0)
+        after = (goal_tiles[from_idx] != 0) + (tile != goal_tiles[to_idx])
+        return after - before
+
+
+@functools.lru_cache(maxsize=32)
+def heuristic_context(goal: NPuzzleBoard) -> HeuristicContext:
+    """Returns the (cached) `HeuristicContext` for `goal`."""
+    return HeuristicContext(goal)
 
 
 def cumulative_distance(current: NPuzzleBoard, goal: NPuzzleBoard):
@@ -13,21 +170,7 @@ def cumulative_distance(current: NPuzzleBoard, goal: NPuzzleBoard):
     adjacent pieces need to be swapped. Then this function returns `2`, since both
     pieces would have to perform one step.
     """
-    h = 0
-    rows_len, cols_len = (len(current.state), len(current.state[0]))
-    for row_i in range(rows_len):
-        for col_i in range(cols_len):
-            val = current.state[row_i][col_i]
-            if val is None:
-                continue
-            # find `val's` goal position
-            goal_pos = goal.get_pos_of(val)
-            if goal_pos is None:
-                # ignore silently if `val` wasnt found...
-                continue
-            else:
-                h += current.step_distance(Vec2(row_i, col_i), goal_pos)
-    return h
+    return heuristic_context(goal).manhattan(current.tiles)
 
 
 def cumulative_distance_with_linear_conflicts(current: NPuzzleBoard, goal: NPuzzleBoard):
@@ -41,59 +184,84 @@ def cumulative_distance_with_linear_conflicts(current: NPuzzleBoard, goal: NPuzz
     tiles has to "move away", let the other pass and move back again (since we are not
     allowed to simply swap tiles).
     """
-    h_manhattan = cumulative_distance(current, goal)
+    ctx = heuristic_context(goal)
+    tiles = current.tiles
+    return ctx.manhattan(tiles) + ctx.linear_conflicts(tiles)
 
-    def count_conflicts(current_r_or_c: list, goal_r_or_c: list):
-        """
-        1) goal_idxs = "for each val retrieve goal index inside current row/col"
-        2) for each idx in goal_idxs:
-            - check if __subsequent__ elements cross idx's value's goal path 
-                - yes: conflict += 2
-                - no: next
-        """
-        def index_or_none(arr, val):
-            try:
-                return arr.index(val)
-            except ValueError:
-                return None
 
-        # contains each corresponding goal index (None if not in current row/col)
-        goal_idxs = [index_or_none(goal_r_or_c, v) for v in current_r_or_c]
+def count_wrong_positions(current: NPuzzleBoard, goal: NPuzzleBoard):
+    """Aka. 'Misplaced Tiles Heuristic'."""
+    return heuristic_context(goal).misplaced(current.tiles)
 
-        conflicts = 0
-        for i, g_i in enumerate(goal_idxs):
-            if current_r_or_c[i] is None:
-                continue
-            if g_i is None:
-                # tile with goal that's not in current row/col
-                continue
-            else:
-                for j in range(i + 1, len(goal_idxs)): # look to the right for conflicts
-                    other_g_i = goal_idxs[j]
-                    if (other_g_i is not None and other_g_i < g_i):
-                        conflicts += 2
-        return conflicts
 
-    def get_column(matrix: list[list], col_i: int) -> list:
-        return [row[col_i] for row in matrix]
+def walking_distance(current: NPuzzleBoard, goal: NPuzzleBoard):
+    """
+    Aka. 'Walking Distance Heuristic'.
 
-    rows_len, cols_len = (len(current.state), len(current.state[0]))
-    conflicts = 0
-    for row_i in range(rows_len):
-        conflicts += count_conflicts(current.state[row_i], goal.state[row_i])
+    Looks at rows only: Which tiles are in which row doesn't tell where exactly a
+    tile is, but only the empty field can exchange tiles between adjacent rows,
+    one move at a time. The minimum number of such exchanges to bring every tile
+    into its goal row is looked up in a precomputed table. The same is done for
+    the columns and both are added.
 
-    for col_i in range(cols_len):
-        conflicts += count_conflicts(
-            get_column(current.state, col_i),
-            get_column(goal.state, col_i))
+    More informed than `cumulative_distance_with_linear_conflicts`, while the
+    tables stay small for boards up to 4x4 (~25.000 entries each). They are built
+    once per board shape and empty field goal position.
+    """
+    return heuristic_context(goal).walking_distance(current.tiles)
 
-    return h_manhattan + conflicts
 
+@functools.lru_cache(maxsize=None)
+def _walking_distance_table(n_lines: int, line_len: int, blank_goal_line: int) -> dict[tuple, int]:
+    """
+    Breadth first search from the goal configuration over all configurations
+    `(*<counts>, <empty field line>)`, where `counts[l * n_lines + g]` is the number
+    of tiles in line `l` belonging to line `g`. Returns the distance of each.
+    """
+    counts = [0] * (n_lines * n_lines)
+    for line in range(n_lines):
+        counts[line * n_lines + line] = line_len - (1 if line == blank_goal_line else 0)
+    start = (*counts, blank_goal_line)
 
-def count_wrong_positions(current: NPuzzleBoard, goal: NPuzzleBoard):
-    """Aka. 'Misplaced Tiles Heuristic'."""
-    counter = 0
-    for row1, row2 in zip(current.state, goal.state):
-        for val1, val2 in zip(row1, row2):
-            counter += 1 if val1 != val2 else 0
-    return counter
+    table = {start: 0}
+    queue = deque([start])
+    while queue:
+        config = queue.popleft()
+        dist = table[config] + 1
+        blank = config[-1]
+        for other in (blank - 1, blank + 1):
+            if not 0 <= other < n_lines:
+                continue
+            for goal_line in range(n_lines):
+                src, dst = (other * n_lines + goal_line, blank * n_lines + goal_line)
+                if config[src] == 0:
+                    continue
+                # tile moves from line `other` into the empty field's line
+                new_config = list(config)
+                new_config[src] -= 1
+                new_config[dst] += 1
+                new_config[-1] = other
+                new_config = tuple(new_config)
+                if new_config not in table:
+                    table[new_config] = dist
+                    queue.append(new_config)
+    return table
+
+
+# heuristic function -> name of the matching `HeuristicContext` delta method
+_DELTA_METHODS = {
+    cumulative_distance: "manhattan_delta",
+    cumulative_distance_with_linear_conflicts: "linear_conflicts_delta",
+    count_wrong_positions: "misplaced_delta",
+}
+
+
+def heuristic_delta_fn(heuristic_fn, goal: NPuzzleBoard):
+    """
+    Returns a function `delta(tiles, tile, from_idx, to_idx) -> int` rating how much
+    `heuristic_fn` changes, when `tile` slides from `from_idx` into the empty field
+    at `to_idx` (`tiles` being the state after the move).
+    Returns `None`, if there is no incremental version of `heuristic_fn`.
+    """
+    method = _DELTA_METHODS.get(heuristic_fn)
+    return None if method is None else getattr(heuristic_context(goal), method)
@@ -5,15 +5,34 @@ One reason beeing, that a 4x4 board ("15 Puzzle") has `16!/9! = 57.657.600` time
 the amount of permutations a 3x3 board has.
 """
 
+from dataclasses import dataclass
+
 from n_puzzle import NPuzzleBoard, NPuzzleGame, MoveDirection
-from search_strategy import SearchStrategyBase
+from search_node import SearchNode
+from search_strategy import SearchStrategyBase, DirectSearchBase
+
+
+@dataclass
+class SolverStats:
+    """Counters of the last `NPuzzleSolver.solve()` run."""
+    # states taken from the frontier and expanded
+    expanded: int = 0
+    # child states created by expansions
+    generated: int = 0
+    # generated states dropped, since they were already reached with lower or equal costs
+    duplicates: int = 0
+    # generated states queued again, since they were reached with lower costs than before
+    reopened: int = 0
+    # frontier entries skipped, since their state was reached with lower costs meanwhile
+    stale: int = 0
 
 
 class NPuzzleSolver:
-    def __init__(self, game: NPuzzleGame, search_strategy: SearchStrategyBase):
+    def __init__(self, game: NPuzzleGame, search_strategy: SearchStrategyBase | DirectSearchBase):
         self.game = game
         self.search_strategy = search_strategy
         self.solution = None
+        self.stats = SolverStats()
 
     def solve(self, exhaustive_search=False) -> list | None:
         """
@@ -30,47 +49,67 @@ class NPuzzleSolver:
 
         strategy = self.search_strategy
 
-        strategy.apply([([], self.game.board)])
-        visited = set()
-        best_history: list[MoveDirection] = None
+        stats = self.stats
 
-        counter = 0
-        while not strategy.is_done():
-            counter += 1
+        if isinstance(strategy, DirectSearchBase):
+            # strategy doesn't use an expansion queue, let it do the search
+            self.solution = strategy.search(self.game.board, self.game.goal_board)
+            stats.expanded = strategy.expanded
+            print(f"Expansions to finish: {stats.expanded}")
+            return self.solution
 
-            entry: tuple[list, NPuzzleBoard] = strategy.pop_state_entry()
+        root = SearchNode(self.game.board)
+        strategy.apply([root])
+        # lowest known path costs per state. Entries are never removed from the frontier,
+        # instead outdated ones are skipped when popped ("lazy deletion").
+        best_g = {root.state: 0}
+        best_node: SearchNode | None = None
 
-            history, state = entry
-            visited.add(state)
+        while not strategy.is_done():
+            node: SearchNode = strategy.pop_state_entry()
+            if node.g > best_g[node.state]:
+                stats.stale += 1
+                continue
+            stats.expanded += 1
 
             best_cost, curr_cost = (
-                strategy.path_cost(best_history),
-                strategy.path_cost(history)
+                strategy.path_cost(best_node),
+                strategy.path_cost(node)
             )
 
-            if self.game.goal_board == state \
-                    and (best_history is None or best_cost > curr_cost):
-                best_history = history
+            if self.game.goal_board == node.state \
+                    and (best_node is None or best_cost > curr_cost):
+                best_node = node
                 if exhaustive_search:
                     continue
-                elif len(best_history) == 0:
+                elif best_node.g == 0:
                     # start state is goal_state, cant get better than that
                     break
                 else:
                     break
 
-            elif best_history is not None and best_cost < curr_cost:
+            elif best_node is not None and best_cost < curr_cost:
                 # dont branch any deeper, if already found solution is better than current path
                 continue
 
-            candidates = state.next_valid_board_states(history)
-            candidates = [(h, s) for h, s in candidates if s not in visited]
+            candidates = []
+            for child in node.expand():
+                stats.generated += 1
+                known_g = best_g.get(child.state)
+                if known_g is not None:
+                    if known_g <= child.g:
+                        stats.duplicates += 1
+                        continue
+                    stats.reopened += 1
+                best_g[child.state] = child.g
+                candidates.append(child)
 
             strategy.apply(candidates)
 
-        print(f"Expansions to finish: {counter}")
-        self.solution = best_history
-        return best_history
+        print(f"Expansions to finish: {stats.expanded} (generated: {stats.generated}, "
+              f"duplicates pruned: {stats.duplicates}, re-opened: {stats.reopened})")
+        self.solution = None if best_node is None else best_node.path()
+        return self.solution
 
     @classmethod
     def is_solvable(cls, game: NPuzzleGame) -> bool:
@@ -98,14 +137,13 @@ class NPuzzleSolver:
 
     @staticmethod
     def count_required_transpositions(start_board: NPuzzleBoard, goal_board: NPuzzleBoard) -> int:
-        def flatten(arr): return [val for row in arr for val in row]
-        start = flatten(start_board.state)
-        goal = flatten(goal_board.state)
+        start = list(start_board.tiles)
+        goal = goal_board.tiles
 
         swaps_count = 0
         for goal_i, v in enumerate(goal):
             # Example: goal_i=2
-            #  goal: [1, 2, 3, 4, 5, 6, 7, 8, 0]
+            #  goal: [1, 2, 3, 4, 5, 6, 7, 8, 0]  (0 = empty field)
             #        .......^
             # start: [1, 2, 7, 5, 0, 4, 6, 8, 3]
             #               ^←             ← ^^^(start_i=8)
@@ -141,4 +179,5 @@ class NPuzzleSolver:
     def reset(self):
         """Resets this solver to its initial state."""
         self.solution = None
+        self.stats = SolverStats()
         self.search_strategy.reset()
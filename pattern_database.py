@@ -0,0 +1,230 @@
+"""
+Additive disjoint pattern databases (PDBs).
+
+The tiles of a goal board are split into disjoint groups ("patterns"). For each
+pattern a table stores the minimum number of moves of _its_ tiles, needed to
+bring them from any placement to their goal fields, ignoring all other tiles'
+identities. Since each move moves exactly one tile, the sum over all patterns
+is still a lower bound of the solution length, but a far better informed one
+than `cumulative_distance_with_linear_conflicts`.
+
+Building the tables is expensive (minutes to hours for 6-7 tile patterns), so
+they are meant to be built once, `save()`d and `load()`ed afterwards. Loading
+memory-maps the file, so multiple solver processes share the same pages.
+"""
+
+import mmap
+import struct
+
+from n_puzzle import NPuzzleBoard
+
+# Partitions of the goal board's fields (row-major indices), by board shape.
+# Tiles are assigned to patterns by their field on the goal board.
+DEFAULT_PARTITIONS: dict[tuple[int, int], list[tuple[int, ...]]] = {
+    (3, 3): [(0, 1, 3, 4), (2, 5, 6, 7)],
+    # "6-6-3" (for the standard goal: tiles 1,5,6,9,10,13 / 7,8,11,12,14,15 / 2,3,4)
+    (4, 4): [(0, 4, 5, 8, 9, 12), (6, 7, 10, 11, 13, 14), (1, 2, 3)],
+    (5, 5): [(0, 1, 5, 6, 10, 11), (2, 3, 4, 7, 8, 9), (12, 13, 14, 17, 18, 19),
+             (15, 16, 20, 21, 22, 23)],
+}
+
+# "7-8" partition of the 4x4 board
+PARTITION_4X4_7_8: list[tuple[int, ...]] = [(0, 4, 5, 8, 9, 12, 13), (1, 2, 3, 6, 7, 10, 11, 14)]
+
+_MAGIC = b"NPDB"
+_VERSION = 1
+# value of table entries, that haven't been reached
+_UNREACHED = 255
+
+
+def partition_tiles(goal: NPuzzleBoard, partition: list[tuple[int, ...]]) -> list[tuple[int, ...]]:
+    """Maps a partition of goal fields to the tiles the goal board has there."""
+    tiles = goal.tiles
+    patterns = [tuple(tiles[idx] for idx in fields) for fields in partition]
+    if any(0 in pattern for pattern in patterns):
+        raise ValueError("partition contains the goal board's empty field")
+    return patterns
+
+
+def rank_placement(positions, n_fields: int) -> int:
+    """
+    Returns a unique index in `range(n_fields! / (n_fields - k)!)` for the
+    placement of `k` distinct tiles on the given `positions`.
+    """
+    rank = 0
+    for i, pos in enumerate(positions):
+        smaller_before = 0
+        for other in positions[:i]:
+            if other < pos:
+                smaller_before += 1
+        rank = rank * (n_fields - i) + pos - smaller_before
+    return rank
+
+
+def placement_count(k: int, n_fields: int) -> int:
+    count = 1
+    for i in range(k):
+        count *= n_fields - i
+    return count
+
+
+class PatternDatabase:
+    """
+    Set of additive pattern tables for one goal board.
+
+    An instance can be used as ordinary heuristic function `(current, goal) -> int`,
+    e.g. `AStarSearch(goal, pdb)` or `IDAStarSearch(goal, pdb)`.
+    """
+
+    def __init__(self, goal: NPuzzleBoard, patterns: list[tuple[int, ...]], tables: list):
+        """
+        Use `build()` or `load()` rather than creating instances directly.
+        - `patterns`: the tiles of each pattern.
+        - `tables`: for each pattern a byte buffer, indexed by `rank_placement()` of
+            the pattern tiles' positions (in pattern order).
+        """
+        self.goal = goal
+        self.patterns = patterns
+        self.tables = tables
+        self._n_fields = goal.N + 1
+        self._mmap = None
+
+    def __call__(self, current: NPuzzleBoard, goal: NPuzzleBoard) -> int:
+        if goal is not self.goal and goal != self.goal:
+            raise ValueError("pattern database was built for a different goal board")
+        return self.heuristic(current.tiles)
+
+    def heuristic(self, tiles) -> int:
+        """Sum of all pattern tables' entries for the flat `tiles`."""
+        positions = [0] * (max(tiles) + 1)
+        for idx, val in enumerate(tiles):
+            positions[val] = idx
+        n_fields = self._n_fields
+        h = 0
+        for pattern, table in zip(self.patterns, self.tables):
+            h += table[rank_placement([positions[tile] for tile in pattern], n_fields)]
+        return h
+
+    def close(self) -> None:
+        """Releases the memory mapping of a `load()`ed database."""
+        if self._mmap is not None:
+            for table in self.tables:
+                table.release()
+            self._mmap.close()
+            self._mmap = None
+
+    @classmethod
+    def build(cls, goal: NPuzzleBoard, partition: list[tuple[int, ...]] | None = None) -> 'PatternDatabase':
+        """
+        Builds the tables for `goal`, by a breadth first search backwards from it.
+        `partition` defaults to the entry of `DEFAULT_PARTITIONS` for the goal's shape.
+        """
+        if partition is None:
+            try:
+                partition = DEFAULT_PARTITIONS[goal.shape]
+            except KeyError:
+                raise ValueError(f"no default partition for boards of shape {goal.shape}") from None
+        patterns = partition_tiles(goal, partition)
+        return cls(goal, patterns, [_build_table(goal, pattern) for pattern in patterns])
+
+    def save(self, path: str) -> None:
+        """
+        Writes the database to `path`. Layout (little endian):
+        magic, version, rows, cols, pattern count, goal tiles, then per pattern:
+        tile count, tiles, table.
+        """
+        rows, cols = self.goal.shape
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<HHHH", _VERSION, rows, cols, len(self.patterns)))
+            f.write(struct.pack(f"<{rows * cols}H", *self.goal.tiles))
+            for pattern, table in zip(self.patterns, self.tables):
+                f.write(struct.pack(f"<H{len(pattern)}H", len(pattern), *pattern))
+                f.write(table)
+
+    @classmethod
+    def load(cls, path: str) -> 'PatternDatabase':
+        """Memory-maps the database written to `path` by `save()`."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:4] != _MAGIC:
+            mm.close()
+            raise ValueError(f"'{path}' is no pattern database file")
+        version, rows, cols, n_patterns = struct.unpack_from("<HHHH", mm, 4)
+        if version != _VERSION:
+            mm.close()
+            raise ValueError(f"unsupported pattern database version {version}")
+
+        offset = 12
+        n_fields = rows * cols
+        goal_tiles = struct.unpack_from(f"<{n_fields}H", mm, offset)
+        offset += 2 * n_fields
+        goal = NPuzzleBoard.from_tiles(
+            bytes(goal_tiles) if max(goal_tiles) < 256 else goal_tiles, rows, cols)
+
+        view = memoryview(mm)
+        patterns, tables = ([], [])
+        for _ in range(n_patterns):
+            (k,) = struct.unpack_from("<H", mm, offset)
+            patterns.append(struct.unpack_from(f"<{k}H", mm, offset + 2))
+            offset += 2 + 2 * k
+            size = placement_count(k, n_fields)
+            tables.append(view[offset:offset + size])
+            offset += size
+
+        pdb = cls(goal, patterns, tables)
+        pdb._mmap = mm
+        return pdb
+
+
+def _build_table(goal: NPuzzleBoard, pattern: tuple[int, ...]) -> bytearray:
+    """
+    Breadth first search from `goal` over placements of the `pattern` tiles plus
+    the empty field. Moves of non-pattern tiles are free, so instead of the exact
+    empty field position only the region of non-pattern fields it can reach is
+    distinguished (represented by its smallest field index).
+    """
+    rows, cols = goal.shape
+    n_fields = rows * cols
+    neighbours = []
+    for idx in range(n_fields):
+        row, col = divmod(idx, cols)
+        neighbours.append([r * cols + c for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                           if 0 <= r < rows and 0 <= c < cols])
+
+    table = bytearray([_UNREACHED]) * placement_count(len(pattern), n_fields)
+    # (placement rank, empty field region) pairs already expanded
+    done = bytearray(len(table) * n_fields)
+
+    frontier = [(tuple(goal.tiles.index(tile) for tile in pattern), goal.blank_index)]
+    depth = 0
+    while frontier:
+        next_frontier = []
+        for positions, blank in frontier:
+            occupied = set(positions)
+            # fields the empty field reaches, by moving non-pattern tiles only
+            region = [blank]
+            seen = {blank}
+            for field in region:
+                for nb in neighbours[field]:
+                    if nb not in seen and nb not in occupied:
+                        seen.add(nb)
+                        region.append(nb)
+
+            rank = rank_placement(positions, n_fields)
+            key = rank * n_fields + min(region)
+            if done[key]:
+                continue
+            done[key] = 1
+            if table[rank] == _UNREACHED:
+                table[rank] = depth
+
+            # move a pattern tile into the region
+            for field in region:
+                for nb in neighbours[field]:
+                    if nb in occupied:
+                        i = positions.index(nb)
+                        next_frontier.append((positions[:i] + (field,) + positions[i + 1:], nb))
+        frontier = next_frontier
+        depth += 1
+    return table
@@ -0,0 +1,36 @@
+"""
+Perfect hashing of board permutations: maps each permutation of `range(n)` to a
+unique integer in `range(n!)` ("rank") and back.
+"""
+
+from math import factorial
+
+
+def lehmer_rank(perm) -> int:
+    """
+    Returns the lexicographic rank of `perm` (a permutation of `range(len(perm))`),
+    computed from its Lehmer code. `O(n²)`.
+    """
+    n = len(perm)
+    rank = 0
+    for i in range(n):
+        smaller_after = 0
+        val = perm[i]
+        for j in range(i + 1, n):
+            if perm[j] < val:
+                smaller_after += 1
+        rank = rank * (n - i) + smaller_after
+    return rank
+
+
+def lehmer_unrank(rank: int, n: int) -> list[int]:
+    """Inverse of `lehmer_rank`."""
+    if not 0 <= rank < factorial(n):
+        raise ValueError(f"rank {rank} out of range for permutations of {n} elements")
+    # Lehmer code digits, least significant (last position) first
+    digits = []
+    for base in range(1, n + 1):
+        rank, digit = divmod(rank, base)
+        digits.append(digit)
+    remaining = list(range(n))
+    return [remaining.pop(digit) for digit in reversed(digits)]
@@ -0,0 +1,39 @@
+from n_puzzle import MoveDirection
+
+
+class SearchNode:
+    """
+    A state reached during a search. Instead of a copy of the whole move history,
+    each node only knows the `move` leading to it and its `parent` node, the path
+    is reconstructed once via `path()`.
+
+    - `g`: path costs, i.e. number of moves from the initial state
+    - `h`: heuristic rating of `state`, if the search strategy uses one
+    """
+    __slots__ = ("state", "parent", "move", "g", "h")
+
+    def __init__(self, state, parent: 'SearchNode | None' = None,
+                 move: MoveDirection | None = None, g: int = 0, h: int | None = None):
+        self.state = state
+        self.parent = parent
+        self.move = move
+        self.g = g
+        self.h = h
+
+    def __repr__(self) -> str:
+        return f"SearchNode({self.state!r}, move={self.move!r}, g={self.g}, h={self.h})"
+
+    def expand(self) -> list['SearchNode']:
+        """Returns a child node for every valid move of the empty field."""
+        g = self.g + 1
+        return [SearchNode(state, self, mv_dir, g) for mv_dir, state in self.state.successors()]
+
+    def path(self) -> list[MoveDirection]:
+        """Returns the moves leading from the initial state to this node."""
+        moves = []
+        node = self
+        while node.parent is not None:
+            moves.append(node.move)
+            node = node.parent
+        moves.reverse()
+        return moves
@@ -1,4 +1,33 @@
-from queue import Queue, LifoQueue, PriorityQueue
+from abc import ABC, abstractmethod
+
+from frontier import FifoFrontier, LifoFrontier, HeapFrontier, BucketFrontier
+from n_puzzle_heuristics import heuristic_delta_fn
+from search_node import SearchNode
+
+
+class DirectSearchBase(ABC):
+    """
+    Base class for strategies, which search for a solution on their own rather
+    than feeding an expansion queue. `NPuzzleSolver` hands the complete search
+    over to `search()`.
+    """
+
+    def __init__(self):
+        # number of states expanded by the last `search()`
+        self.expanded = 0
+
+    @abstractmethod
+    def search(self, start, goal) -> list | None:
+        """
+        Returns the moves of the empty field transforming `start` into `goal`.
+        `start` must be solvable, i.e. check `NPuzzleSolver.is_solvable` first.
+        """
+
+    def reset(self):
+        """
+        Resets internal state of this strategy, so it can be reused again.
+        """
+        pass
 
 
 class SearchStrategyBase:
@@ -7,15 +36,15 @@ class SearchStrategyBase:
     the 'state expansion queue'.
     """
 
-    def __init__(self, queue: Queue):
+    def __init__(self, queue: FifoFrontier | LifoFrontier | HeapFrontier | BucketFrontier):
         self.queue = queue
 
-    def apply(self, new_state_entries: list[tuple[list, any]]):
+    def apply(self, new_state_entries: list[SearchNode]):
         """
         Adds all state entries from `new_state_entries` to the expansion queue.
 
-        Each `entry` should be a tuple of past steps, to calculate current costs with 
-        and the associated state.
+        Each `entry` is a `SearchNode`, holding the state, its path costs and a
+        link to the node it was expanded from.
         """
         for s in new_state_entries:
             self.add_state_entry(s)
@@ -32,14 +61,14 @@ class SearchStrategyBase:
         """
         self.queue.put(entry)
 
-    def pop_state_entry(self) -> any:
+    def pop_state_entry(self) -> SearchNode:
         """
         Returns next entry and removes it from the underlying queue.
         """
         return self.queue.get()
 
-    def path_cost(self, history: list):
-        return 0 if history is None else len(history)
+    def path_cost(self, node: SearchNode | None):
+        return 0 if node is None else node.g
 
     def reset(self):
         """
@@ -54,7 +83,7 @@ class DepthFirstSearch(SearchStrategyBase):
     """
 
     def __init__(self):
-        super().__init__(LifoQueue())
+        super().__init__(LifoFrontier())
 
 
 class BreadthFirstSearch(SearchStrategyBase):
@@ -63,7 +92,7 @@ class BreadthFirstSearch(SearchStrategyBase):
     """
 
     def __init__(self):
-        super().__init__(Queue())
+        super().__init__(FifoFrontier())
 
 
 class AStarSearch(SearchStrategyBase):
@@ -71,27 +100,46 @@ class AStarSearch(SearchStrategyBase):
     A strategy aimed for `A*` search implementation. Internally utilizes a priority
     queue. Requires the target/goal state and a fitting heuristic function upon creation.
 
-    Maintains a PriorityQueue of tuples, where first element is the priority (based on
-    the state's approx. costs) and the second element is the usual entry consisting
-    of a list (e.g. move history) and the actual state.
+    By default entries are kept in a `HeapFrontier` prioritized by `(f, h)`, i.e. the
+    state's approx. costs with ties broken in favor of states closer to the goal and
+    then by insertion order. Passing `frontier=BucketFrontier` instead keeps one bucket
+    per (integer) `f`-value, which is faster but requires an integer heuristic.
+    The state's heuristic value is stored in the entry's `h`.
+
+    If the heuristic supports incremental evaluation (see
+    `n_puzzle_heuristics.heuristic_delta_fn`), expanded states are rated from their
+    parent's heuristic value, so a full evaluation only happens for the initial state.
     """
 
-    def __init__(self, goal_state, heuristic_fn):
-        super().__init__(PriorityQueue())
+    def __init__(self, goal_state, heuristic_fn, frontier: type = HeapFrontier):
+        super().__init__(frontier())
+        # buckets are indexed by f only, heaps additionally break ties by h
+        self._f_only = issubclass(frontier, BucketFrontier)
 
         self.goal = goal_state
         # function that given an input state and the goal state returns a rating for input
         self.hfn = heuristic_fn
+        self.h_delta = heuristic_delta_fn(heuristic_fn, goal_state)
 
-    def apply(self, new_state_entries: list):
-        for entry in new_state_entries:
-            history, state = entry
-            approx_cost = self.approx_cost(history, state)
-            self.add_state_entry((approx_cost, entry))
+    def apply(self, new_state_entries: list[SearchNode]):
+        for node in new_state_entries:
+            node.h = self.heuristic(node)
+            self.add_state_entry(node)
 
-    def pop_state_entry(self) -> any:
-        _, entry = self.queue.get()
-        return entry
+    def add_state_entry(self, entry: SearchNode):
+        f = entry.g + entry.h
+        self.queue.put(entry, f if self._f_only else (f, entry.h))
 
-    def approx_cost(self, history: list, state):
-        return self.path_cost(history) + self.hfn(state, self.goal)
+    def heuristic(self, node: SearchNode):
+        """
+        Rates `node`'s state. If the parent node is already rated, the rating is
+        derived from the parent's if possible.
+        """
+        parent = node.parent
+        if parent is None or parent.h is None or self.h_delta is None:
+            return self.hfn(node.state, self.goal)
+        state = node.state
+        to_idx = parent.state.blank_index
+        from_idx = state.blank_index
+        tiles = state.tiles
+        return parent.h + self.h_delta(tiles, tiles[to_idx], from_idx, to_idx)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from distance_table import DistanceTable
+from n_puzzle import NPuzzleBoard as Board, NPuzzleGame as Game, MoveDirection as mv
+from n_puzzle_heuristics import cumulative_distance
+from n_puzzle_solver import NPuzzleSolver as Solver
+from permutation_rank import lehmer_rank, lehmer_unrank
+from search_strategy import AStarSearch
+
+
+class TestLehmerRank(unittest.TestCase):
+    def test_roundtrip(self):
+        ranks = [lehmer_rank(lehmer_unrank(r, 5)) for r in range(120)]
+        self.assertEqual(ranks, list(range(120)))
+        self.assertEqual(lehmer_unrank(0, 4), [0, 1, 2, 3])
+        self.assertEqual(lehmer_rank([3, 2, 1, 0]), 23)
+
+
+class TestDistanceTable(unittest.TestCase):
+    GOAL = Board([[1, 2, 3], [4, 5, None]])
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = DistanceTable.build(cls.GOAL)
+
+    def test_half_reachable(self):
+        self.assertEqual(sum(dist != 255 for dist in self.table.table), 360)
+
+    def test_optimal_solutions(self):
+        boards = [Board.random_board(n_pieces=5) for _ in range(20)]
+        for start in (Board([[None, 5, 4], [3, 2, 1]]), *boards):
+            start = Board([row for row in start.state[:2]]) if start.shape == (2, 3) else start
+            game = Game(start, self.GOAL)
+            if not Solver.is_solvable(game):
+                self.assertIsNone(self.table.solve(start))
+                continue
+            expected = Solver(game, AStarSearch(self.GOAL, cumulative_distance)).solve()
+            steps = self.table.solve(start)
+            self.assertEqual(len(steps), len(expected))
+            board = start
+            for step in steps:
+                board = board.with_move(step)
+            self.assertEqual(board, self.GOAL)
+
+    def test_as_strategy(self):
+        start = Board([[1, 2, 3], [4, None, 5]])
+        self.assertEqual(Solver(Game(start, self.GOAL), self.table).solve(), [mv.RIGHT])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "2x3.pdt")
+            self.table.save(path)
+            loaded = DistanceTable.for_goal(self.GOAL, path)
+            self.assertEqual(loaded.goal, self.GOAL)
+            self.assertEqual(loaded.table, self.table.table)
+
+
+if __name__ == '__main__':
+    unittest.main()
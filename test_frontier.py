@@ -0,0 +1,36 @@
+import unittest
+
+from frontier import FifoFrontier, LifoFrontier, HeapFrontier, BucketFrontier
+
+
+class TestFrontiers(unittest.TestCase):
+    def fill(self, frontier, items_and_prios):
+        for item, prio in items_and_prios:
+            frontier.put(item, prio)
+        return [frontier.get() for _ in range(len(frontier))]
+
+    def test_fifo_lifo(self):
+        entries = [("a", None), ("b", None), ("c", None)]
+        self.assertEqual(self.fill(FifoFrontier(), entries), ["a", "b", "c"])
+        self.assertEqual(self.fill(LifoFrontier(), entries), ["c", "b", "a"])
+
+    def test_heap_ties_in_insertion_order(self):
+        # items themselves must never be compared
+        a, b, c = object(), object(), object()
+        frontier = HeapFrontier()
+        self.assertEqual(self.fill(frontier, [(a, (3, 1)), (b, (2, 0)), (c, (3, 1))]), [b, a, c])
+        self.assertTrue(frontier.empty())
+
+    def test_buckets(self):
+        frontier = BucketFrontier()
+        self.assertEqual(self.fill(frontier, [("a", 5), ("b", 3), ("c", 5), ("d", 7)]),
+                         ["b", "c", "a", "d"])
+        frontier.put("e", 4)
+        frontier.put("f", 2)
+        self.assertEqual(frontier.get(), "f")
+        self.assertEqual(frontier.get(), "e")
+        self.assertRaises(IndexError, frontier.get)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 import n_puzzle_heuristics as epheur
@@ -29,6 +30,95 @@ class TestHeuristics(unittest.TestCase):
         curr, goal = (goal, curr)
         self.assertEqual(epheur.cumulative_distance(curr, goal), 7)
 
+    def test_linear_conflicts_heur_1(self):
+        curr = Board([[2, 1, 3], [4, 5, 6], [7, 8, None]])
+        goal = Board([[1, 2, 3], [4, 5, 6], [7, 8, None]])
+        self.assertEqual(epheur.cumulative_distance_with_linear_conflicts(curr, goal), 4)
+
+    def test_linear_conflicts_ignore_empty_field(self):
+        # empty field "passing" a tile in its goal row is no conflict
+        curr = Board([[1, 2, 3], [4, 6, None], [7, 8, 5]])
+        goal = Board([[1, 2, 3], [4, None, 6], [7, 8, 5]])
+        self.assertEqual(epheur.cumulative_distance_with_linear_conflicts(curr, goal), 1)
+
+
+class TestWalkingDistance(unittest.TestCase):
+    def test_goal_is_zero(self):
+        goal = Board([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, None]])
+        self.assertEqual(epheur.walking_distance(goal, goal), 0)
+
+    def test_adjacent_swap_in_row(self):
+        # both tiles are in their goal row and column, but the row must be left
+        curr = Board([[2, 1, 3], [4, 5, 6], [7, 8, None]])
+        goal = Board([[1, 2, 3], [4, 5, 6], [7, 8, None]])
+        self.assertGreaterEqual(epheur.walking_distance(curr, goal), 4)
+
+    def test_admissible_and_dominates_manhattan(self):
+        from n_puzzle import NPuzzleGame as Game
+        from n_puzzle_solver import NPuzzleSolver as Solver
+        from search_strategy import AStarSearch
+
+        rng = random.Random(11)
+        goal = Board([[1, 2, 3], [8, None, 4], [7, 6, 5]])
+        for _ in range(10):
+            start = goal
+            for _ in range(30):
+                _, start = rng.choice(start.successors())
+            wd = epheur.walking_distance(start, goal)
+            optimal = Solver(Game(start, goal), AStarSearch(goal, epheur.cumulative_distance)).solve()
+            self.assertGreaterEqual(wd, epheur.cumulative_distance(start, goal))
+            self.assertLessEqual(wd, len(optimal))
+
+
+class TestHeuristicContext(unittest.TestCase):
+    def test_tables(self):
+        goal = Board([[1, 2, 3], [8, None, 4], [7, 6, 5]])
+        ctx = epheur.heuristic_context(goal)
+        self.assertIs(ctx, epheur.heuristic_context(goal.clone()))
+        self.assertEqual((ctx.goal_row[4], ctx.goal_col[4]), (1, 2))
+        self.assertEqual(ctx.distances[4][0], 3)
+        self.assertEqual(ctx.distances[0], [0] * 9)
+
+    def test_line_conflicts(self):
+        goal = Board([[1, 2, 3], [4, 5, 6], [7, 8, None]])
+        tiles = Board([[3, 2, 1], [4, 5, 6], [7, 8, None]]).tiles
+        ctx = epheur.heuristic_context(goal)
+        self.assertEqual(ctx.line_conflicts(tiles, 0), 6)
+        self.assertEqual(ctx.linear_conflicts(tiles), 6)
+
+
+class TestIncrementalHeuristics(unittest.TestCase):
+    HEURISTICS = [
+        epheur.cumulative_distance,
+        epheur.cumulative_distance_with_linear_conflicts,
+        epheur.count_wrong_positions,
+    ]
+
+    def run_random_walk(self, start: Board, goal: Board, steps: int):
+        rng = random.Random(7)
+        for hfn in self.HEURISTICS:
+            delta = epheur.heuristic_delta_fn(hfn, goal)
+            board = start
+            h = hfn(board, goal)
+            for _ in range(steps):
+                _, child = rng.choice(board.successors())
+                to_idx, from_idx = (board.blank_index, child.blank_index)
+                h += delta(child.tiles, child.tiles[to_idx], from_idx, to_idx)
+                self.assertEqual(h, hfn(child, goal), hfn.__name__)
+                board = child
+
+    def test_random_walk_8pg(self):
+        goal = Board([[1, 2, 3], [8, None, 4], [7, 6, 5]])
+        self.run_random_walk(goal, goal, 300)
+
+    def test_random_walk_15pg(self):
+        goal = Board([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, None]])
+        self.run_random_walk(goal, goal, 300)
+
+    def test_unknown_heuristic(self):
+        goal = Board([[1, 2], [3, None]])
+        self.assertIsNone(epheur.heuristic_delta_fn(lambda curr, goal: 0, goal))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 
 from n_puzzle import NPuzzleBoard as Board
 from n_puzzle import MoveDirection as mv
+from search_node import SearchNode
 
 
 class Test8PuzzleBoard(unittest.TestCase):
@@ -159,5 +160,57 @@ class Test15PuzzleBoard(unittest.TestCase):
         self.assertEqual(next_states, expect_next_states)
 
 
+class TestPackedBoard(unittest.TestCase):
+    def test_state_view_roundtrip(self):
+        s_init = [[2, 8, 3], [1, 6, 4], [7, None, 5]]
+        board = Board(s_init)
+        self.assertEqual(board.state, s_init)
+        self.assertEqual(board.tiles, bytes([2, 8, 3, 1, 6, 4, 7, 0, 5]))
+        self.assertEqual(board.blank_index, 7)
+        self.assertEqual(board.shape, (3, 3))
+
+    def test_with_move(self):
+        board = Board([[2, 8, 3], [1, 6, 4], [7, None, 5]])
+        self.assertEqual(board.with_move(mv.UP), Board([[2, 8, 3], [1, None, 4], [7, 6, 5]]))
+        self.assertIsNone(board.with_move(mv.DOWN))
+        # original board is untouched
+        self.assertEqual(board, Board([[2, 8, 3], [1, 6, 4], [7, None, 5]]))
+
+    def test_hash_and_eq(self):
+        b1 = Board([[1, 2], [3, None]])
+        b2 = Board([[1, 2], [None, 3]]).with_move(mv.RIGHT)
+        self.assertEqual(b1, b2)
+        self.assertEqual(len({b1, b2, b1.clone()}), 1)
+
+    def test_packed(self):
+        board = Board([[1, 2], [3, None]])
+        self.assertEqual(board.bits_per_tile, 2)
+        self.assertEqual(board.packed, 0b01_10_11_00)
+
+    def test_large_values(self):
+        board = Board([[300, None], [1, 2]])
+        self.assertEqual(board.tiles, (300, 0, 1, 2))
+        self.assertEqual(board.with_move(mv.LEFT).state, [[None, 300], [1, 2]])
+
+    def test_invalid_states(self):
+        self.assertRaises(ValueError, Board, [[1, 2], [3, 4]])
+        self.assertRaises(ValueError, Board, [[1, None], [None, 4]])
+        self.assertRaises(ValueError, Board, [[1, 2], [3]])
+
+
+class TestSearchNode(unittest.TestCase):
+    def test_expand_and_path(self):
+        root = SearchNode(Board([[2, 8, 3], [1, 6, 4], [7, None, 5]]))
+        children = root.expand()
+        self.assertEqual([c.move for c in children], [mv.UP, mv.RIGHT, mv.LEFT])
+        self.assertTrue(all(c.g == 1 and c.parent is root for c in children))
+
+        grandchild = [c for c in children[0].expand() if c.move is mv.UP][0]
+        self.assertEqual(grandchild.g, 2)
+        self.assertEqual(grandchild.path(), [mv.UP, mv.UP])
+        self.assertEqual(grandchild.state, Board([[2, None, 3], [1, 8, 4], [7, 6, 5]]))
+        self.assertEqual(root.path(), [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,8 @@
+import random
 import unittest
 
+from frontier import BucketFrontier
+from iterative_deepening import IDAStarSearch
 from n_puzzle_solver import NPuzzleSolver as Solver
 from n_puzzle import MoveDirection as mv, NPuzzleBoard as Board, NPuzzleGame as Game
 from n_puzzle_heuristics import *
@@ -26,6 +29,25 @@ class TestNPuzzleSolver(unittest.TestCase):
         steps_expected = [mv.RIGHT, mv.DOWN, mv.DOWN, mv.RIGHT]
         run_solve_test(self, start, goal, steps_expected)
 
+    def test_solvable_bucket_frontier(self):
+        start = Board([[4, 1, 8], [6, 3, 5], [7, 2, None]])
+        goal = Board([[1, 2, 3], [4, 5, 6], [7, 8, None]])
+        strategy = AStarSearch(goal, cumulative_distance_with_linear_conflicts, frontier=BucketFrontier)
+        steps = Solver(Game(start, goal), strategy).solve()
+        self.assertEqual(len(steps), 18)
+
+    def test_stats(self):
+        start = Board([[2, 8, 3], [1, 6, 4], [7, None, 5]])
+        goal = Board([[1, 2, 3], [8, None, 4], [7, 6, 5]])
+        solver = Solver(Game(start, goal), BreadthFirstSearch())
+        solver.solve()
+        stats = solver.stats
+        self.assertEqual(stats.expanded, 37)
+        self.assertGreater(stats.duplicates, 0)
+        # each state is queued at most once with breadth first
+        self.assertEqual(stats.reopened, 0)
+        self.assertLessEqual(stats.generated - stats.duplicates, stats.expanded + len(solver.search_strategy.queue))
+
     def test_unsolvable_1(self):
         npb8_start = Board([[2, 1, 7], [5, 8, 3], [4, 6, None]])
         npb8_goal = Board([[1, 2, 3], [8, None, 4], [7, 6, 5]])
@@ -38,5 +60,51 @@ class TestNPuzzleSolver(unittest.TestCase):
         run_solve_test(self, npb15_start, npb15_goal, steps_expected)
 
 
+class TestIDAStarSearch(unittest.TestCase):
+    def solve(self, start, goal, hfn=cumulative_distance_with_linear_conflicts):
+        return Solver(Game(start, goal), IDAStarSearch(goal, hfn)).solve()
+
+    def test_solvable_8pg_1(self):
+        start = Board([[2, 8, 3], [1, 6, 4], [7, None, 5]])
+        goal = Board([[1, 2, 3], [8, None, 4], [7, 6, 5]])
+        self.assertEqual(self.solve(start, goal), [mv.UP, mv.UP, mv.LEFT, mv.DOWN, mv.RIGHT])
+
+    def test_solvable_15pg_1(self):
+        start = Board([[1, 2, 3, 4], [5, None, 6, 8], [9, 10, 7, 12], [13, 14, 11, 15]])
+        goal = Board([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, None]])
+        self.assertEqual(self.solve(start, goal), [mv.RIGHT, mv.DOWN, mv.DOWN, mv.RIGHT])
+
+    def test_unsolvable(self):
+        start = Board([[2, 1, 7], [5, 8, 3], [4, 6, None]])
+        goal = Board([[1, 2, 3], [8, None, 4], [7, 6, 5]])
+        self.assertIsNone(self.solve(start, goal))
+
+    def test_heuristic_below_optimal_cost(self):
+        # h(start) = 6 < 8 moves, requires raising the bound
+        start = Board([[2, 5, 3], [4, 1, 6], [None, 7, 8]])
+        goal = Board([[1, 2, 3], [4, 5, 6], [7, 8, None]])
+        self.assertEqual(cumulative_distance(start, goal), 6)
+        self.assertEqual(len(self.solve(start, goal, cumulative_distance)), 8)
+
+        start = Board([[4, 1, 8], [6, 3, 5], [7, 2, None]])
+        self.assertEqual(len(self.solve(start, goal, cumulative_distance)), 18)
+
+    def test_optimal_like_astar(self):
+        rng = random.Random(3)
+        goal = Board([[1, 2, 3], [4, 5, 6], [7, 8, None]])
+        for _ in range(5):
+            start = goal
+            for _ in range(20):
+                _, start = rng.choice(start.successors())
+            a_star = Solver(Game(start, goal), AStarSearch(goal, cumulative_distance)).solve()
+            for hfn in (cumulative_distance, count_wrong_positions, cumulative_distance_with_linear_conflicts):
+                ida_star = self.solve(start, goal, hfn)
+                self.assertEqual(len(ida_star), len(a_star))
+                board = start
+                for step in ida_star:
+                    board = board.with_move(step)
+                self.assertEqual(board, goal)
+
+
 if __name__ == '__main__':
     unittest.main()
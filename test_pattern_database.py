@@ -0,0 +1,58 @@
+import os
+import random
+import tempfile
+import unittest
+
+from iterative_deepening import IDAStarSearch
+from n_puzzle import NPuzzleBoard as Board, NPuzzleGame as Game
+from n_puzzle_heuristics import cumulative_distance
+from n_puzzle_solver import NPuzzleSolver as Solver
+from pattern_database import PatternDatabase, rank_placement, placement_count
+from search_strategy import AStarSearch
+
+
+class TestPatternDatabase(unittest.TestCase):
+    GOAL = Board([[1, 2, 3], [4, 5, 6], [7, 8, None]])
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pdb = PatternDatabase.build(cls.GOAL)
+
+    def test_rank_placement(self):
+        ranks = {rank_placement((a, b), 4) for a in range(4) for b in range(4) if a != b}
+        self.assertEqual(ranks, set(range(placement_count(2, 4))))
+
+    def test_goal_is_zero(self):
+        self.assertEqual(self.pdb(self.GOAL, self.GOAL), 0)
+
+    def test_admissible_and_dominates_manhattan(self):
+        rng = random.Random(5)
+        for _ in range(10):
+            start = self.GOAL
+            for _ in range(30):
+                _, start = rng.choice(start.successors())
+            optimal = Solver(Game(start, self.GOAL), AStarSearch(self.GOAL, cumulative_distance)).solve()
+            h = self.pdb(start, self.GOAL)
+            self.assertLessEqual(h, len(optimal))
+            self.assertGreaterEqual(h, cumulative_distance(start, self.GOAL))
+            ida_star = Solver(Game(start, self.GOAL), IDAStarSearch(self.GOAL, self.pdb)).solve()
+            self.assertEqual(len(ida_star), len(optimal))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "3x3.pdb")
+            self.pdb.save(path)
+            loaded = PatternDatabase.load(path)
+            self.assertEqual(loaded.goal, self.GOAL)
+            self.assertEqual(loaded.patterns, self.pdb.patterns)
+            board = Board([[8, 7, 6], [5, 4, 3], [2, 1, None]])
+            self.assertEqual(loaded(board, self.GOAL), self.pdb(board, self.GOAL))
+            loaded.close()
+
+    def test_wrong_goal(self):
+        other_goal = Board([[None, 1, 2], [3, 4, 5], [6, 7, 8]])
+        self.assertRaises(ValueError, self.pdb, self.GOAL, other_goal)
+
+
+if __name__ == '__main__':
+    unittest.main()